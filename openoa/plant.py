@@ -67,9 +67,7 @@ def _analysis_filter(
     categories = ("scada", "meter", "tower", "curtail", "reanalysis", "asset")
     requirements = {key: ANALYSIS_REQUIREMENTS[key] for key in analysis_types}
     column_requirements = {
-        cat: set(
-            itertools.chain(*[r.get(cat, {}).get("columns", []) for r in requirements.values()])
-        )
+        cat: set().union(*(r.get(cat, {}).get("columns", ()) for r in requirements.values()))
         for cat in categories
     }
     for key, value in column_requirements.items():
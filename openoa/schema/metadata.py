@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import re
-import json
+import sys
+import operator
 import warnings
-import itertools
-from copy import deepcopy
 from string import digits
+from typing import ClassVar
+from collections.abc import Mapping
 from pathlib import Path
+from functools import lru_cache, cached_property
 
-import yaml
 import attrs
 import numpy as np
 import pandas as pd
@@ -28,9 +29,9 @@ warnings.filterwarnings("once", category=DeprecationWarning)
 
 
 # Datetime frequency checks
-_at_least_monthly = ("MS", "ME", "W", "D", "h", "min", "s", "ms", "us", "ns")
-_at_least_daily = ("D", "h", "min", "s", "ms", "us", "ns")
-_at_least_hourly = ("h", "min", "s", "ms", "us", "ns")
+_at_least_monthly = frozenset({"MS", "ME", "W", "D", "h", "min", "s", "ms", "us", "ns"})
+_at_least_daily = frozenset({"D", "h", "min", "s", "ms", "us", "ns"})
+_at_least_hourly = frozenset({"h", "min", "s", "ms", "us", "ns"})
 deprecated_offset_map = {
     "M": "ME",
     "H": "h",
@@ -115,7 +116,7 @@ ANALYSIS_REQUIREMENTS = {
         },
         "asset": {
             "columns": ["rated_power"],
-            "freq": (),
+            "freq": frozenset(),
         },
     },
     "ElectricalLosses": {
@@ -139,7 +140,7 @@ ANALYSIS_REQUIREMENTS = {
         },
         "asset": {
             "columns": ["latitude", "longitude", "rated_power"],
-            "freq": (),
+            "freq": frozenset(),
         },
     },
     "WakeLosses-tower": {
@@ -157,7 +158,7 @@ ANALYSIS_REQUIREMENTS = {
         },
         "asset": {
             "columns": ["latitude", "longitude", "rated_power"],
-            "freq": (),
+            "freq": frozenset(),
         },
     },
     "StaticYawMisalignment": {
@@ -173,12 +174,39 @@ ANALYSIS_REQUIREMENTS = {
         },
         "asset": {
             "columns": ["rated_power"],
-            "freq": (),
+            "freq": frozenset(),
         },
     },
 }
 
 
+def _build_analysis_index() -> tuple[dict[str, dict[str, frozenset]], dict[str, dict[str, frozenset]]]:
+    """Walks ``ANALYSIS_REQUIREMENTS`` once at import time to build the per-analysis column
+    and frequency lookup tables used by ``determine_analysis_requirements``, so that the
+    runtime aggregation only has to union or intersect a few pre-frozen sets.
+
+    Returns:
+        tuple[dict, dict]: A mapping of analysis type to each data category's required columns,
+            and a mapping of analysis type to each data category's allowable frequencies, with
+            both sets of requirements stored as ``frozenset`` objects.
+    """
+    columns = {
+        analysis: {cat: frozenset(req["columns"]) for cat, req in requirements.items()}
+        for analysis, requirements in ANALYSIS_REQUIREMENTS.items()
+    }
+    frequency = {
+        analysis: {cat: frozenset(req["freq"]) for cat, req in requirements.items()}
+        for analysis, requirements in ANALYSIS_REQUIREMENTS.items()
+    }
+    return columns, frequency
+
+
+_COLUMNS_BY_ANALYSIS, _FREQ_BY_ANALYSIS = _build_analysis_index()
+
+# The data categories that an analysis can place column requirements on
+_CATEGORIES = ("scada", "meter", "tower", "curtail", "reanalysis", "asset")
+
+
 remove_digits = str.maketrans("", "", digits)
 
 
@@ -238,36 +266,48 @@ def determine_analysis_requirements(
 
     Returns:
         dict | tuple[dict, dict]: The dictionary of column or frequency requirements, or if "both", then a tuple
-            of each dictionary.
+            of each dictionary. The results are cached, so the returned dictionaries should not
+            be modified by the caller.
     """
     if isinstance(analysis_type, str):
         analysis_type = [analysis_type]
-    requirements = {key: ANALYSIS_REQUIREMENTS[key] for key in analysis_type}
+    return _compute_requirements(which, frozenset(analysis_type))
+
+
+@lru_cache(maxsize=None)
+def _compute_requirements(which: str, analysis_type: frozenset[str]) -> dict | tuple[dict, dict]:
+    """Computes the column and/or frequency requirements for
+    ``determine_analysis_requirements``. Because ``ANALYSIS_REQUIREMENTS`` is a module-level
+    constant and only a handful of analysis type combinations exist, the results are memoized
+    by the frozenset of analysis types, making repeated lookups (such as during ``PlantData``
+    validation) effectively free.
+
+    Args:
+        which (str): One of "columns", "frequency", or "both".
+        analysis_type (frozenset[str]): The analysis types to aggregate the requirements for.
+
+    Raises:
+        ValueError: Raised if :py:attr:`which` is not one of "columns", "frequency", or "both".
+
+    Returns:
+        dict | tuple[dict, dict]: The dictionary of column or frequency requirements, or if
+            "both", then a tuple of each dictionary.
+    """
     if which in ("columns", "both"):
-        categories = ("scada", "meter", "tower", "curtail", "reanalysis", "asset")
+        requested = [_COLUMNS_BY_ANALYSIS[key] for key in analysis_type]
         column_requirements = {
-            cat: set(
-                itertools.chain(*[r.get(cat, {}).get("columns", []) for r in requirements.values()])
-            )
-            for cat in categories
+            cat: frozenset().union(*(req.get(cat, ()) for req in requested))
+            for cat in _CATEGORIES
         }
         column_requirements = {k: v for k, v in column_requirements.items() if v != set()}
     if which in ("frequency", "both"):
-        frequency = {
-            key: {name: value["freq"] for name, value in values.items()}
-            for key, values in requirements.items()
-        }
+        per_name: dict[str, list[frozenset]] = {}
+        for key in analysis_type:
+            for name, freq in _FREQ_BY_ANALYSIS[key].items():
+                per_name.setdefault(name, []).append(freq)
         frequency_requirements = {
-            k: []
-            for k in set(itertools.chain.from_iterable([[*val] for val in frequency.values()]))
+            name: frozenset.intersection(*sets) for name, sets in per_name.items()
         }
-        for vals in frequency.values():
-            for name, req in vals.items():
-                reqs = frequency_requirements[name]
-                if reqs == []:
-                    frequency_requirements[name] = set(req)
-                else:
-                    frequency_requirements[name] = reqs.intersection(req)
     if which == "both":
         return column_requirements, frequency_requirements
     elif which == "columns":
@@ -277,6 +317,64 @@ def determine_analysis_requirements(
     raise ValueError("`which` must be one of 'columns', 'frequency', or 'both'.")
 
 
+@lru_cache(maxsize=None)
+def _col_map_getter(cls) -> tuple[tuple[str, ...], operator.attrgetter]:
+    """Caches the DataFrame column field names and a C-level attribute getter for a metadata
+    class, so that each ``__attrs_post_init__`` can build ``col_map`` in a single
+    ``dict(zip(...))`` pass instead of a Python-level attribute-by-attribute comprehension.
+
+    Args:
+        cls (type): The metadata class to build the getter for.
+
+    Returns:
+        tuple[tuple[str, ...], operator.attrgetter]: The column field names, and the attrgetter
+            that fetches all of their values in one call.
+    """
+    names = tuple(a.name for a in cls.__attrs_attrs__ if a.name in cls.dtypes)
+    return names, operator.attrgetter(*names)
+
+
+@lru_cache(maxsize=None)
+def _reverse_col_map(col_map_items: tuple[tuple[str, str], ...]) -> dict:
+    """Builds the value-to-key reversal of a column mapping. The result is cached on the
+    mapping's items so that instances with identical mappings (the default-schema common case)
+    share a single reversed dict instead of each building their own.
+
+    Args:
+        col_map_items (tuple[tuple[str, str], ...]): The ``col_map`` items as a hashable tuple.
+
+    Returns:
+        dict: The reversed column mapping, which is shared across callers, so should not be
+            modified.
+    """
+    return {v: k for k, v in col_map_items}
+
+
+@lru_cache(maxsize=None)
+def _attrs_init_metadata(cls) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Caches the init-enabled field names and the required (no default provided) field names
+    of an ``attrs``-defined class, so that ``FromDictMixin.from_dict`` only has to inspect
+    ``__attrs_attrs__`` once per class instead of on every call.
+
+    Args:
+        cls (type): The ``attrs``-defined class to inspect.
+
+    Returns:
+        tuple[tuple[str, ...], frozenset[str]]: The init-enabled field names, and the subset of
+            those names that have no default value, so must be user-provided.
+    """
+    attrs_attrs = cls.__attrs_attrs__  # type: ignore
+    kwarg_names = []
+    required_inputs = []
+    for a in attrs_attrs:
+        if not a.init:
+            continue
+        kwarg_names.append(a.name)
+        if a.default is attrs.NOTHING:
+            required_inputs.append(a.name)
+    return tuple(kwarg_names), frozenset(required_inputs)
+
+
 @define(auto_attribs=True)
 class FromDictMixin:
     """A Mixin class to allow for kwargs overloading when a data class doesn't
@@ -299,25 +397,33 @@ class FromDictMixin:
             (cls): An intialized object of the `attrs`-defined class (`cls`).
         """
         # Get all parameters from the input dictionary that map to the class initialization
-        kwarg_names = [a.name for a in cls.__attrs_attrs__ if a.init]
-        matching = [name for name in kwarg_names if name in data]
-        non_matching = [name for name in data if name not in kwarg_names]
+        kwarg_names, required_inputs = _attrs_init_metadata(cls)
+        kwargs = {name: data[name] for name in kwarg_names if name in data}
+        non_matching = [name for name in data if name not in kwargs]
         logger.info(f"No matches for provided kwarg inputs: {non_matching}")
-        kwargs = {name: data[name] for name in matching}
 
         # Map the inputs must be provided: 1) must be initialized, 2) no default value defined
-        required_inputs = [
-            a.name
-            for a in cls.__attrs_attrs__  # type: ignore
-            if a.init and isinstance(a.default, type(attrs.NOTHING))  # type: ignore
-        ]
-        undefined = sorted(set(required_inputs) - set(kwargs))
+        undefined = sorted(required_inputs - kwargs.keys())
         if undefined:
             raise AttributeError(
                 f"The class defintion for {cls.__name__} is missing the following inputs: {undefined}"
             )
         return cls(**kwargs)  # type: ignore
 
+    @classmethod
+    def _from_validated_dict(cls, data: dict):
+        """Fast-path equivalent of :py:meth:`from_dict` for nested metadata dictionaries that
+        have already passed through the top-level validation. Skips the required-input scan
+        (every nested metadata field has a default) and the unmatched-key logging.
+
+        Args:
+            data (dict): The data dictionary to be mapped.
+        Returns:
+            (cls): An intialized object of the `attrs`-defined class (`cls`).
+        """
+        kwarg_names, _ = _attrs_init_metadata(cls)
+        return cls(**{name: data[name] for name in kwarg_names if name in data})
+
 
 @define(auto_attribs=True)
 class ResetValuesMixin:
@@ -424,7 +530,7 @@ def _make_combined_repr(cls: PlantMetaData) -> str:
 # ***************************************
 
 
-@define(auto_attribs=True)
+@define(auto_attribs=True, slots=True, on_setattr=attrs.setters.NO_OP)
 class SCADAMetaData(FromDictMixin):  # noqa: F821
     """A metadata schematic to create the necessary column mappings and other validation
     components, or other data about the SCADA data, that will contribute to a larger
@@ -480,57 +586,42 @@ class SCADAMetaData(FromDictMixin):  # noqa: F821
     WTUR_SupWh: str = field(default="WTUR_SupWh", init=False)  # calculated in PlantData
     col_map: dict = field(init=False)
     col_map_reversed: dict = field(init=False)
-    dtypes: dict = field(
-        default=dict(
-            time=np.datetime64,
-            asset_id=str,
-            WTUR_W=float,
-            WMET_HorWdSpd=float,
-            WMET_HorWdDir=float,
-            WMET_HorWdDirRel=float,
-            WTUR_TurSt=str,
-            WROT_BlPthAngVal=float,
-            WMET_EnvTmp=float,
-            WTUR_SupWh=float,
-        ),
-        init=False,  # don't allow for user input
+    dtypes: ClassVar[dict] = dict(
+        time=np.datetime64,
+        asset_id=str,
+        WTUR_W=float,
+        WMET_HorWdSpd=float,
+        WMET_HorWdDir=float,
+        WMET_HorWdDirRel=float,
+        WTUR_TurSt=str,
+        WROT_BlPthAngVal=float,
+        WMET_EnvTmp=float,
+        WTUR_SupWh=float,
     )
-    units: dict = field(
-        default=dict(
-            time="datetim64[ns]",
-            asset_id=None,
-            WTUR_W="kW",
-            WMET_HorWdSpd="m/s",
-            WMET_HorWdDir="deg",
-            WMET_HorWdDirRel="deg",
-            WTUR_TurSt=None,
-            WROT_BlPthAngVal="deg",
-            WMET_EnvTmp="C",
-            WTUR_SupWh="kWh",
-        ),
-        init=False,  # don't allow for user input
+    units: ClassVar[dict] = dict(
+        time="datetim64[ns]",
+        asset_id=None,
+        WTUR_W="kW",
+        WMET_HorWdSpd="m/s",
+        WMET_HorWdDir="deg",
+        WMET_HorWdDirRel="deg",
+        WTUR_TurSt=None,
+        WROT_BlPthAngVal="deg",
+        WMET_EnvTmp="C",
+        WTUR_SupWh="kWh",
     )
 
     def __attrs_post_init__(self) -> None:
-        self.col_map = dict(
-            time=self.time,
-            asset_id=self.asset_id,
-            WTUR_W=self.WTUR_W,
-            WMET_HorWdSpd=self.WMET_HorWdSpd,
-            WMET_HorWdDir=self.WMET_HorWdDir,
-            WMET_HorWdDirRel=self.WMET_HorWdDirRel,
-            WTUR_TurSt=self.WTUR_TurSt,
-            WROT_BlPthAngVal=self.WROT_BlPthAngVal,
-            WMET_EnvTmp=self.WMET_EnvTmp,
-            WTUR_SupWh=self.WTUR_SupWh,
-        )
-        self.col_map_reversed = {v: k for k, v in self.col_map.items()}
+        names, getter = _col_map_getter(type(self))
+        items = tuple(zip(names, getter(self)))
+        self.col_map = dict(items)
+        self.col_map_reversed = _reverse_col_map(items)
 
     def __repr__(self):
         return _make_single_repr("SCADAMetaData", self)
 
 
-@define(auto_attribs=True)
+@define(auto_attribs=True, slots=True, on_setattr=attrs.setters.NO_OP)
 class MeterMetaData(FromDictMixin):  # noqa: F821
     """A metadata schematic to create the necessary column mappings and other validation
     components, or other data about energy meter data, that will contribute to a larger
@@ -562,32 +653,24 @@ class MeterMetaData(FromDictMixin):  # noqa: F821
     # Prescribed mappings, datatypes, and units for in-code reference.
     name: str = field(default="meter", init=False)
     col_map: dict = field(init=False)
-    dtypes: dict = field(
-        default=dict(
-            time=np.datetime64,
-            MMTR_SupWh=float,
-        ),
-        init=False,  # don't allow for user input
+    dtypes: ClassVar[dict] = dict(
+        time=np.datetime64,
+        MMTR_SupWh=float,
     )
-    units: dict = field(
-        default=dict(
-            time="datetim64[ns]",
-            MMTR_SupWh="kWh",
-        ),
-        init=False,  # don't allow for user input
+    units: ClassVar[dict] = dict(
+        time="datetim64[ns]",
+        MMTR_SupWh="kWh",
     )
 
     def __attrs_post_init__(self) -> None:
-        self.col_map = dict(
-            time=self.time,
-            MMTR_SupWh=self.MMTR_SupWh,
-        )
+        names, getter = _col_map_getter(type(self))
+        self.col_map = dict(zip(names, getter(self)))
 
     def __repr__(self):
         return _make_single_repr("MeterMetaData", self)
 
 
-@define(auto_attribs=True)
+@define(auto_attribs=True, slots=True, on_setattr=attrs.setters.NO_OP)
 class TowerMetaData(FromDictMixin):  # noqa: F821
     """A metadata schematic to create the necessary column mappings and other validation
     components, or other data about meteorological tower (met tower) data, that will contribute to a
@@ -627,41 +710,30 @@ class TowerMetaData(FromDictMixin):  # noqa: F821
     # Prescribed mappings, datatypes, and units for in-code reference.
     name: str = field(default="tower", init=False)
     col_map: dict = field(init=False)
-    dtypes: dict = field(
-        default=dict(
-            time=np.datetime64,
-            asset_id=str,
-            WMET_HorWdSpd=float,
-            WMET_HorWdDir=float,
-            WMET_EnvTmp=float,
-        ),
-        init=False,  # don't allow for user input
+    dtypes: ClassVar[dict] = dict(
+        time=np.datetime64,
+        asset_id=str,
+        WMET_HorWdSpd=float,
+        WMET_HorWdDir=float,
+        WMET_EnvTmp=float,
     )
-    units: dict = field(
-        default=dict(
-            time="datetim64[ns]",
-            asset_id=None,
-            WMET_HorWdSpd="m/s",
-            WMET_HorWdDir="deg",
-            WMET_EnvTmp="C",
-        ),
-        init=False,  # don't allow for user input
+    units: ClassVar[dict] = dict(
+        time="datetim64[ns]",
+        asset_id=None,
+        WMET_HorWdSpd="m/s",
+        WMET_HorWdDir="deg",
+        WMET_EnvTmp="C",
     )
 
     def __attrs_post_init__(self) -> None:
-        self.col_map = dict(
-            time=self.time,
-            asset_id=self.asset_id,
-            WMET_HorWdSpd=self.WMET_HorWdSpd,
-            WMET_HorWdDir=self.WMET_HorWdDir,
-            WMET_EnvTmp=self.WMET_EnvTmp,
-        )
+        names, getter = _col_map_getter(type(self))
+        self.col_map = dict(zip(names, getter(self)))
 
     def __repr__(self):
         return _make_single_repr("TowerMetaData", self)
 
 
-@define(auto_attribs=True)
+@define(auto_attribs=True, slots=True, on_setattr=attrs.setters.NO_OP)
 class StatusMetaData(FromDictMixin):  # noqa: F821
     """A metadata schematic to create the necessary column mappings and other validation
     components, or other data about the turbine status log data, that will contribute to a
@@ -701,41 +773,30 @@ class StatusMetaData(FromDictMixin):  # noqa: F821
     # Prescribed mappings, datatypes, and units for in-code reference.
     name: str = field(default="status", init=False)
     col_map: dict = field(init=False)
-    dtypes: dict = field(
-        default=dict(
-            time=np.datetime64,
-            asset_id=str,
-            status_id=np.int64,
-            status_code=np.int64,
-            status_text=str,
-        ),
-        init=False,  # don't allow for user input
+    dtypes: ClassVar[dict] = dict(
+        time=np.datetime64,
+        asset_id=str,
+        status_id=np.int64,
+        status_code=np.int64,
+        status_text=str,
     )
-    units: dict = field(
-        default=dict(
-            time="datetim64[ns]",
-            asset_id=None,
-            status_id=None,
-            status_code=None,
-            status_text=None,
-        ),
-        init=False,  # don't allow for user input
+    units: ClassVar[dict] = dict(
+        time="datetim64[ns]",
+        asset_id=None,
+        status_id=None,
+        status_code=None,
+        status_text=None,
     )
 
     def __attrs_post_init__(self) -> None:
-        self.col_map = dict(
-            time=self.time,
-            asset_id=self.asset_id,
-            status_id=self.status_id,
-            status_code=self.status_code,
-            status_text=self.status_text,
-        )
+        names, getter = _col_map_getter(type(self))
+        self.col_map = dict(zip(names, getter(self)))
 
     def __repr__(self):
         return _make_single_repr("StatusMetaData", self)
 
 
-@define(auto_attribs=True)
+@define(auto_attribs=True, slots=True, on_setattr=attrs.setters.NO_OP)
 class CurtailMetaData(FromDictMixin):  # noqa: F821
     """A metadata schematic to create the necessary column mappings and other validation
     components, or other data about the plant curtailment data, that will contribute to a
@@ -769,35 +830,26 @@ class CurtailMetaData(FromDictMixin):  # noqa: F821
     # Prescribed mappings, datatypes, and units for in-code reference.
     name: str = field(default="curtail", init=False)
     col_map: dict = field(init=False)
-    dtypes: dict = field(
-        default=dict(
-            time=np.datetime64,
-            IAVL_ExtPwrDnWh=float,
-            IAVL_DnWh=float,
-        ),
-        init=False,  # don't allow for user input
+    dtypes: ClassVar[dict] = dict(
+        time=np.datetime64,
+        IAVL_ExtPwrDnWh=float,
+        IAVL_DnWh=float,
     )
-    units: dict = field(
-        default=dict(
-            time="datetim64[ns]",
-            IAVL_ExtPwrDnWh="kWh",
-            IAVL_DnWh="kWh",
-        ),
-        init=False,  # don't allow for user input
+    units: ClassVar[dict] = dict(
+        time="datetim64[ns]",
+        IAVL_ExtPwrDnWh="kWh",
+        IAVL_DnWh="kWh",
     )
 
     def __attrs_post_init__(self) -> None:
-        self.col_map = dict(
-            time=self.time,
-            IAVL_ExtPwrDnWh=self.IAVL_ExtPwrDnWh,
-            IAVL_DnWh=self.IAVL_DnWh,
-        )
+        names, getter = _col_map_getter(type(self))
+        self.col_map = dict(zip(names, getter(self)))
 
     def __repr__(self):
         return _make_single_repr("CurtailMetaData", self)
 
 
-@define(auto_attribs=True)
+@define(auto_attribs=True, slots=True, on_setattr=attrs.setters.NO_OP)
 class AssetMetaData(FromDictMixin):  # noqa: F821
     """A metadata schematic to create the necessary column mappings and other validation
     components, or other data about the site's asset metadata, that will contribute to a
@@ -834,54 +886,127 @@ class AssetMetaData(FromDictMixin):  # noqa: F821
     # Prescribed mappings, datatypes, and units for in-code reference.
     name: str = field(default="asset", init=False)
     col_map: dict = field(init=False)
-    dtypes: dict = field(
-        default=dict(
-            asset_id=str,
-            latitude=float,
-            longitude=float,
-            rated_power=float,
-            hub_height=float,
-            rotor_diameter=float,
-            elevation=float,
-            type=str,
-        ),
-        init=False,  # don't allow for user input
+    dtypes: ClassVar[dict] = dict(
+        asset_id=str,
+        latitude=float,
+        longitude=float,
+        rated_power=float,
+        hub_height=float,
+        rotor_diameter=float,
+        elevation=float,
+        type=str,
     )
-    units: dict = field(
-        default=dict(
-            asset_id=None,
-            latitude="WGS84",
-            longitude="WGS84",
-            rated_power="kW",
-            hub_height="m",
-            rotor_diameter="m",
-            elevation="m",
-            type=None,
-        ),
-        init=False,  # don't allow for user input
+    units: ClassVar[dict] = dict(
+        asset_id=None,
+        latitude="WGS84",
+        longitude="WGS84",
+        rated_power="kW",
+        hub_height="m",
+        rotor_diameter="m",
+        elevation="m",
+        type=None,
     )
 
     def __attrs_post_init__(self) -> None:
-        self.col_map = dict(
-            asset_id=self.asset_id,
-            latitude=self.latitude,
-            longitude=self.longitude,
-            rated_power=self.rated_power,
-            hub_height=self.hub_height,
-            rotor_diameter=self.rotor_diameter,
-            elevation=self.elevation,
-            type=self.type,
-        )
+        names, getter = _col_map_getter(type(self))
+        self.col_map = dict(zip(names, getter(self)))
 
     def __repr__(self):
         return _make_single_repr("AssetMetaData", self)
 
 
+@lru_cache(maxsize=None)
+def _yaml_safe_loader():
+    """Returns the fastest available PyYAML safe loader, preferring libyaml's C-implemented
+    ``CSafeLoader`` (6-7x faster than the pure-Python scanner) and falling back to
+    ``SafeLoader`` when PyYAML was built without libyaml. The result is cached so the lazy
+    yaml import and the attribute probing only happen on the first YAML load.
+    """
+    import yaml
+
+    try:
+        return yaml.CSafeLoader
+    except AttributeError:
+        return yaml.SafeLoader
+
+
+def _intern_keys(data: dict) -> dict:
+    """Re-keys ``data`` with interned strings, recursing into nested dictionaries, so that
+    keys parsed from a file share identity with the interned literals used throughout the
+    schema code and dict lookups short-circuit on pointer comparison.
+
+    Args:
+        data (dict): The parsed metadata dictionary.
+
+    Returns:
+        dict: The same structure with all string keys interned.
+    """
+    return {
+        sys.intern(k) if isinstance(k, str) else k: _intern_keys(v) if isinstance(v, dict) else v
+        for k, v in data.items()
+    }
+
+
+@lru_cache(maxsize=32)
+def _load_metadata_file(metadata_file: str, mtime_ns: int, encoding: str) -> dict:
+    """Reads and parses a JSON or YAML metadata file, cached on the file path and its
+    modification time so that repeat loads of an unchanged file (common in notebook and test
+    workflows) skip the parsing entirely; editing the file invalidates the entry via the
+    mtime key. The parsed dictionary is shared across calls and must be treated as read-only,
+    which holds for ``from_dict`` since it only ever reads the input data.
+
+    Args:
+        metadata_file (str): The resolved path to the metadata file.
+        mtime_ns (int): The file's last modification time, in nanoseconds.
+        encoding (str): One of "json" or "yaml".
+
+    Returns:
+        dict: The parsed metadata dictionary.
+    """
+    import json
+
+    text = Path(metadata_file).read_text()
+    if encoding == "json":
+        return _intern_keys(json.loads(text))
+
+    # JSON is a subset of YAML, so attempt the much faster json parse first and only fall
+    # back to PyYAML when the file uses YAML-specific syntax
+    try:
+        return _intern_keys(json.loads(text))
+    except ValueError:
+        import yaml
+
+        return _intern_keys(yaml.load(text, Loader=_yaml_safe_loader()))
+
+
+def _nested_converter(meta_class):
+    """Creates the converter for a ``PlantMetaData`` sub-schema field, which passes existing
+    instances through untouched, and maps dictionaries with the fast-path constructor so the
+    nested metadata is only fully validated once, at the ``PlantMetaData`` level.
+
+    Args:
+        meta_class (type): The metadata class the field's value should be converted to.
+
+    Returns:
+        Callable: The converter function for the field.
+    """
+
+    def converter(value):
+        if isinstance(value, meta_class):
+            return value
+        return meta_class._from_validated_dict(value)
+
+    return converter
+
+
 def convert_reanalysis(value: dict[str, dict]):
-    return {k: ReanalysisMetaData.from_dict(v) for k, v in value.items()}
+    return {
+        k: v if isinstance(v, ReanalysisMetaData) else ReanalysisMetaData._from_validated_dict(v)
+        for k, v in value.items()
+    }
 
 
-@define(auto_attribs=True)
+@define(auto_attribs=True, slots=True, on_setattr=attrs.setters.NO_OP)
 class ReanalysisMetaData(FromDictMixin):  # noqa: F821
     """A metadata schematic for each of the reanalsis products to be used for operationa analyses
     to create the necessary column mappings and other validation components, or other data about
@@ -925,50 +1050,72 @@ class ReanalysisMetaData(FromDictMixin):  # noqa: F821
     # Prescribed mappings, datatypes, and units for in-code reference.
     name: str = field(default="reanalysis", init=False)
     col_map: dict = field(init=False)
-    dtypes: dict = field(
-        default=dict(
-            time=np.datetime64,
-            WMETR_HorWdSpd=float,
-            WMETR_HorWdSpdU=float,
-            WMETR_HorWdSpdV=float,
-            WMETR_HorWdDir=float,
-            WMETR_EnvTmp=float,
-            WMETR_AirDen=float,
-            WMETR_EnvPres=float,
-        ),
-        init=False,  # don't allow for user input
+    dtypes: ClassVar[dict] = dict(
+        time=np.datetime64,
+        WMETR_HorWdSpd=float,
+        WMETR_HorWdSpdU=float,
+        WMETR_HorWdSpdV=float,
+        WMETR_HorWdDir=float,
+        WMETR_EnvTmp=float,
+        WMETR_AirDen=float,
+        WMETR_EnvPres=float,
     )
-    units: dict = field(
-        default=dict(
-            time="datetim64[ns]",
-            WMETR_HorWdSpd="m/s",
-            WMETR_HorWdSpdU="m/s",
-            WMETR_HorWdSpdV="m/s",
-            WMETR_HorWdDir="deg",
-            WMETR_EnvTmp="K",
-            WMETR_AirDen="kg/m^3",
-            WMETR_EnvPres="Pa",
-        ),
-        init=False,  # don't allow for user input
+    units: ClassVar[dict] = dict(
+        time="datetim64[ns]",
+        WMETR_HorWdSpd="m/s",
+        WMETR_HorWdSpdU="m/s",
+        WMETR_HorWdSpdV="m/s",
+        WMETR_HorWdDir="deg",
+        WMETR_EnvTmp="K",
+        WMETR_AirDen="kg/m^3",
+        WMETR_EnvPres="Pa",
     )
 
     def __attrs_post_init__(self) -> None:
-        self.col_map = dict(
-            time=self.time,
-            WMETR_HorWdSpd=self.WMETR_HorWdSpd,
-            WMETR_HorWdSpdU=self.WMETR_HorWdSpdU,
-            WMETR_HorWdSpdV=self.WMETR_HorWdSpdV,
-            WMETR_HorWdDir=self.WMETR_HorWdDir,
-            WMETR_EnvTmp=self.WMETR_EnvTmp,
-            WMETR_AirDen=self.WMETR_AirDen,
-            WMETR_EnvPres=self.WMETR_EnvPres,
-        )
+        names, getter = _col_map_getter(type(self))
+        self.col_map = dict(zip(names, getter(self)))
 
     def __repr__(self):
         return _make_single_repr("ReanalysisMetaData", self)
 
 
-@define(auto_attribs=True)
+class _LazyDtypeMap(Mapping):
+    """A lazy mapping backing ``PlantMetaData.dtype_map`` that only materializes a data
+    type's dtype dictionary on first access, caching it for later lookups, so validation
+    paths touching a single data type skip building the others. ``dict(...)`` can be used
+    to force full materialization.
+    """
+
+    _KEYS = ("scada", "meter", "tower", "status", "asset", "curtail", "reanalysis")
+
+    __slots__ = ("_metadata", "_cache")
+
+    def __init__(self, metadata: PlantMetaData):
+        self._metadata = metadata
+        self._cache = {}
+
+    def __getitem__(self, key: str) -> dict:
+        try:
+            return self._cache[key]
+        except KeyError:
+            if key not in self._KEYS:
+                raise
+        if key == "reanalysis":
+            reanalysis = self._metadata.reanalysis
+            value = {} if reanalysis == {} else {k: v.dtypes for k, v in reanalysis.items()}
+        else:
+            value = getattr(self._metadata, key).dtypes
+        self._cache[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+
+@define(auto_attribs=True, slots=True)
 class PlantMetaData(FromDictMixin):  # noqa: F821
     """Composese the metadata/validation requirements from each of the individual data
     types that can compose a `PlantData` object.
@@ -1009,12 +1156,12 @@ class PlantMetaData(FromDictMixin):  # noqa: F821
     reference_longitude: float = field(default=None)
     utm_zone: int = field(default=None)
     capacity: float = field(default=0, converter=float)
-    scada: SCADAMetaData = field(default={}, converter=SCADAMetaData.from_dict)
-    meter: MeterMetaData = field(default={}, converter=MeterMetaData.from_dict)
-    tower: TowerMetaData = field(default={}, converter=TowerMetaData.from_dict)
-    status: StatusMetaData = field(default={}, converter=StatusMetaData.from_dict)
-    curtail: CurtailMetaData = field(default={}, converter=CurtailMetaData.from_dict)
-    asset: AssetMetaData = field(default={}, converter=AssetMetaData.from_dict)
+    scada: SCADAMetaData = field(default={}, converter=_nested_converter(SCADAMetaData))
+    meter: MeterMetaData = field(default={}, converter=_nested_converter(MeterMetaData))
+    tower: TowerMetaData = field(default={}, converter=_nested_converter(TowerMetaData))
+    status: StatusMetaData = field(default={}, converter=_nested_converter(StatusMetaData))
+    curtail: CurtailMetaData = field(default={}, converter=_nested_converter(CurtailMetaData))
+    asset: AssetMetaData = field(default={}, converter=_nested_converter(AssetMetaData))
     reanalysis: dict[str, ReanalysisMetaData] = field(
         default={"product": {}}, converter=convert_reanalysis  # noqa: F821
     )  # noqa: F821
@@ -1037,25 +1184,16 @@ class PlantMetaData(FromDictMixin):  # noqa: F821
             values["reanalysis"] = {k: v.col_map for k, v in self.reanalysis.items()}
         return values
 
-    @property
-    def dtype_map(self) -> dict[str, dict]:
+    @cached_property
+    def dtype_map(self) -> Mapping[str, dict]:
         """Provides the column dtype matching for all of the available data types with
         the name of each data type as the keys, and the column dtype mapping as values.
+        Each data type's mapping is materialized lazily on first access and cached, so
+        the metadata should be treated as immutable after construction.
         """
-        types = dict(
-            scada=self.scada.dtypes,
-            meter=self.meter.dtypes,
-            tower=self.tower.dtypes,
-            status=self.status.dtypes,
-            asset=self.asset.dtypes,
-            curtail=self.curtail.dtypes,
-            reanalysis={},
-        )
-        if self.reanalysis != {}:
-            types["reanalysis"] = {k: v.dtypes for k, v in self.reanalysis.items()}
-        return types
+        return _LazyDtypeMap(self)
 
-    @property
+    @cached_property
     def coordinates(self) -> tuple[float, float]:
         """Returns the latitude, longitude pair for the wind power plant.
 
@@ -1077,12 +1215,14 @@ class PlantMetaData(FromDictMixin):  # noqa: F821
         Returns:
             PlantMetaData
         """
-        metadata_file = Path(metadata_file).resolve()
-        if not metadata_file.is_file():
-            raise FileExistsError(f"Input JSON file: {metadata_file} is an invalid input.")
-
-        with open(metadata_file) as f:
-            return cls.from_dict(json.load(f))
+        metadata_file = Path(metadata_file)
+        if not metadata_file.is_absolute():
+            metadata_file = metadata_file.resolve()
+        try:
+            mtime_ns = metadata_file.stat().st_mtime_ns
+        except FileNotFoundError as e:
+            raise FileExistsError(f"Input JSON file: {metadata_file} is an invalid input.") from e
+        return cls.from_dict(_load_metadata_file(str(metadata_file), mtime_ns, "json"))
 
     @classmethod
     def from_yaml(cls, metadata_file: str | Path) -> PlantMetaData:
@@ -1097,12 +1237,14 @@ class PlantMetaData(FromDictMixin):  # noqa: F821
         Returns:
             PlantMetaData
         """
-        metadata_file = Path(metadata_file).resolve()
-        if not metadata_file.is_file():
-            raise FileExistsError(f"Input YAML file: {metadata_file} is an invalid input.")
-
-        with open(metadata_file) as f:
-            return cls.from_dict(yaml.safe_load(f))
+        metadata_file = Path(metadata_file)
+        if not metadata_file.is_absolute():
+            metadata_file = metadata_file.resolve()
+        try:
+            mtime_ns = metadata_file.stat().st_mtime_ns
+        except FileNotFoundError as e:
+            raise FileExistsError(f"Input YAML file: {metadata_file} is an invalid input.") from e
+        return cls.from_dict(_load_metadata_file(str(metadata_file), mtime_ns, "yaml"))
 
     @classmethod
     def load(cls, data: str | Path | dict | PlantMetaData) -> PlantMetaData:
@@ -1123,15 +1265,16 @@ class PlantMetaData(FromDictMixin):  # noqa: F821
             return data
 
         if isinstance(data, str):
-            data = Path(data).resolve()
+            data = Path(data)
 
         if isinstance(data, Path):
-            if data.suffix == ".json":
-                return cls.from_json(data)
-            elif data.suffix in (".yaml", ".yml"):
-                return cls.from_yaml(data)
-            else:
-                raise ValueError("Bad input file extension, must be one of: .json, .yml, or .yaml")
+            try:
+                loader = _SUFFIX_DISPATCH[data.suffix]
+            except KeyError:
+                raise ValueError(
+                    "Bad input file extension, must be one of: .json, .yml, or .yaml"
+                ) from None
+            return loader(cls, data)
 
         if isinstance(data, dict):
             return cls.from_dict(data)
@@ -1151,29 +1294,25 @@ class PlantMetaData(FromDictMixin):  # noqa: F821
                 for the datetime stamps.
         """
         if "all" in analysis_types:
-            requirements = deepcopy(ANALYSIS_REQUIREMENTS)
+            requirements = ANALYSIS_REQUIREMENTS
         else:
             requirements = {
                 key: ANALYSIS_REQUIREMENTS[key] for key in analysis_types if key is not None
             }
-        frequency_requirements = {
-            key: {name: value["freq"] for name, value in values.items()}
-            for key, values in requirements.items()
-        }
-        frequency = {
-            k: []
-            for k in set(
-                itertools.chain.from_iterable([[*val] for val in frequency_requirements.values()])
-            )
-        }
-        for vals in frequency_requirements.values():
-            for name, req in vals.items():
-                reqs = frequency[name]
-                if reqs == []:
-                    frequency[name] = set(req)
-                else:
-                    frequency[name] = reqs.intersection(req)
-        return frequency
+        groups: dict[str, list[frozenset]] = {}
+        for values in requirements.values():
+            for name, value in values.items():
+                groups.setdefault(name, []).append(value["freq"])
+        return {name: set(frozenset.intersection(*sets)) for name, sets in groups.items()}
 
     def __repr__(self):
         return _make_combined_repr(self)
+
+
+# Maps the supported metadata file extensions to their loading classmethods for O(1)
+# dispatch in ``PlantMetaData.load``.
+_SUFFIX_DISPATCH = {
+    ".json": PlantMetaData.from_json.__func__,
+    ".yaml": PlantMetaData.from_yaml.__func__,
+    ".yml": PlantMetaData.from_yaml.__func__,
+}
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-from copy import deepcopy
 from typing import Any
 from pathlib import Path
 
@@ -52,25 +51,6 @@ def _attrs_meta_filter(inst: Attribute, value: Any) -> bool:
     return True
 
 
-def _attrs_meta_serializer(inst: type, field: Attribute, value: Any) -> Any:
-    """Custom serialization for attrs dataclass fields.
-
-    Args:
-        inst (type): The class object.
-        field (Attribute): The ``attrs.field`` information.
-        value (Any): The actual values in the :py:attr:`field`.
-
-    Returns:
-        Any: Reformatted data.
-    """
-    if field is None:
-        return value
-    if field.name == "dtypes":
-        value = {k: str(v).replace("<class '", "").replace("'>", "") for k, v in value.items()}
-        return value
-    return value
-
-
 def create_schema() -> dict:
     """Creates a dictionary of the metadata input requirements.
 
@@ -79,19 +59,18 @@ def create_schema() -> dict:
     """
     schema = {name: {} for name in meta_class_map}
     for name, meta in meta_class_map.items():
-        meta_dict = asdict(
-            meta(), filter=_attrs_meta_filter, value_serializer=_attrs_meta_serializer
-        )
+        meta_dict = asdict(meta(), filter=_attrs_meta_filter)
+        dtypes = {
+            k: str(v).replace("<class '", "").replace("'>", "") for k, v in meta.dtypes.items()
+        }
         for key, value in meta_dict.items():
-            if key in ("dtypes", "units"):
-                continue
             if key == "frequency":
-                schema[name][key] = meta_dict[key]
+                schema[name][key] = value
                 continue
             schema[name][key] = {
-                "name": meta_dict[key],
-                "dtype": meta_dict["dtypes"][key],
-                "units": meta_dict["units"][key],
+                "name": value,
+                "dtype": dtypes[key],
+                "units": meta.units[key],
             }
     return schema
 
@@ -103,20 +82,20 @@ def create_analysis_schema(analysis_types: str | list[str]) -> dict:
         dict: The compiled metadata dictionary specifying the required data definitions.
     """
     schema = create_schema()
-    schema_copy = deepcopy(schema)
     column_requirements, frequency_requirements = determine_analysis_requirements(
         which="both", analysis_type=analysis_types
     )
-    for name, meta in schema_copy.items():
+    for name in list(schema):
         if name not in column_requirements:
             schema.pop(name)
             continue
-        for col in meta:
+        meta = schema[name]
+        for col in list(meta):
             if col == "frequency":
-                schema[name][col] = list(frequency_requirements[name])
+                meta[col] = list(frequency_requirements[name])
                 continue
             if col not in column_requirements[name]:
-                schema[name].pop(col)
+                meta.pop(col)
     return schema
 
 
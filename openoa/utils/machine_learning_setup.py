@@ -167,6 +167,7 @@ class MachineLearningSetup:
         n_iter_search: int = 20,
         report: bool = True,
         verbose: int = 0,
+        n_jobs: int = None,
     ) -> None:
         """
         Optimize hyperparameters through cross-validation
@@ -186,6 +187,9 @@ class MachineLearningSetup:
                 - >1 : the computation time for each fold and parameter candidate is displayed;
                 - >2 : the score is also displayed;
                 - >3 : the fold and candidate parameter indexes are also displayed together with the starting time of the computation.
+            n_jobs(:obj:'int'): Directly fed to `RandomizedSearchCV(n_jobs=n_jobs)`. The number
+                of jobs to run in parallel, with -1 using all processors. Defaults to None
+                (a single job).
 
         Returns:
             (none)
@@ -198,6 +202,7 @@ class MachineLearningSetup:
             n_iter=n_iter_search,
             scoring=self.my_scorer,
             verbose=0,
+            n_jobs=n_jobs,
             return_train_score=True,
         )
         # Fit the model to each combination of hyperparmeters
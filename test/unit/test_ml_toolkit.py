@@ -4,26 +4,27 @@ import unittest
 import numpy as np
 import pandas as pd
 from numpy import testing as nptest
-from sklearn.metrics import mean_squared_error
 from sklearn.model_selection import KFold
 
 from openoa.utils.machine_learning_setup import MachineLearningSetup
 
 
 class TestMLToolkit(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         np.random.seed(42)
 
-        # Create 2 random features, 1st to mimic wind speed, the other air density
-        self.x1 = pd.Series(np.random.random(1000) * 30)  # Wind speed
-        self.x2 = pd.Series(np.random.random(1000) * 360)  # Wind direction
-        self.x3 = pd.Series(1 + np.random.random(1000) * 0.2)  # Air density
+        # Create 2 random features, 1st to mimic wind speed, the other air density, kept
+        # as raw arrays until the single DataFrame assembly below
+        cls.x1 = np.random.random(1000) * 30  # Wind speed
+        cls.x2 = np.random.random(1000) * 360  # Wind direction
+        cls.x3 = 1 + np.random.random(1000) * 0.2  # Air density
 
         # Group features together
-        self.X = pd.DataFrame(data={"ws": self.x1, "wd": self.x2, "dens": self.x3})
+        cls.X = pd.DataFrame(data={"ws": cls.x1, "wd": cls.x2, "dens": cls.x3})
 
         # Create simple power relationship with feature variables
-        self.y = self.x3 * np.power(self.x1, 3) * np.log(self.x2) / 6  # Units of kW
+        cls.y = cls.x3 * cls.x1 * cls.x1 * cls.x1 * np.log(cls.x2) / 6  # Units of kW
 
     def test_algorithms(self):
         # Test different algorithms hyperoptimization and fitting results
@@ -37,42 +38,50 @@ class TestMLToolkit(unittest.TestCase):
             "gam": (0.983174, 1330.0),
         }
 
-        # Loop through algorithms
+        # Loop through algorithms, each as its own subtest so one failing fit doesn't
+        # mask the results of the others
         for a in required_metrics.keys():
-            ml = MachineLearningSetup(a)  # Setup ML object
-
-            # Perform randomized grid search only once for efficiency
-            ml.hyper_optimize(self.X, self.y, n_iter_search=1, report=False, cv=KFold(n_splits=2))
-
-            # Predict power based on model results
-            y_pred = ml.random_search.predict(self.X)
-
-            # Compute performance metrics which we'll test
-            corr = np.corrcoef(self.y, y_pred)[
-                0, 1
-            ]  # Correlation between predicted and actual power
-            rmse = np.sqrt(
-                mean_squared_error(self.y, y_pred)
-            )  # RMSE between predicted and actual power
-
-            # Mean power in GW is within 3 decimal places
-            nptest.assert_approx_equal(
-                self.y.sum() / 1e6,
-                y_pred.sum() / 1e6,
-                significant=3,
-                err_msg="Sum of predicted and actual power for {} not close enough".format(a),
-            )
-
-            # Test correlation of model fit
-            nptest.assert_approx_equal(
-                corr,
-                required_metrics[a][0],
-                significant=4,
-                err_msg="Correlation between {} features and response is wrong".format(a),
-            )
-
-            # Test RMSE of model fit
-            self.assertLess(rmse, required_metrics[a][1], "RMSE of {} fit is too high".format(a))
+            with self.subTest(algorithm=a):
+                ml = MachineLearningSetup(a)  # Setup ML object
+
+                # Perform randomized grid search only once for efficiency
+                ml.hyper_optimize(
+                    self.X, self.y, n_iter_search=1, report=False, cv=KFold(n_splits=2), n_jobs=-1
+                )
+
+                # Predict power based on model results
+                y_pred = ml.random_search.predict(self.X)
+
+                # Compute performance metrics which we'll test
+                dy = self.y - self.y.mean()
+                dp = y_pred - y_pred.mean()
+                corr = (dy @ dp) / np.sqrt(
+                    (dy @ dy) * (dp @ dp)
+                )  # Correlation between predicted and actual power
+                rmse = np.sqrt(
+                    np.mean((self.y - y_pred) ** 2)
+                )  # RMSE between predicted and actual power
+
+                # Mean power in GW is within 3 decimal places
+                nptest.assert_approx_equal(
+                    self.y.sum() / 1e6,
+                    y_pred.sum() / 1e6,
+                    significant=3,
+                    err_msg="Sum of predicted and actual power for {} not close enough".format(a),
+                )
+
+                # Test correlation of model fit
+                nptest.assert_approx_equal(
+                    corr,
+                    required_metrics[a][0],
+                    significant=4,
+                    err_msg="Correlation between {} features and response is wrong".format(a),
+                )
+
+                # Test RMSE of model fit
+                self.assertLess(
+                    rmse, required_metrics[a][1], "RMSE of {} fit is too high".format(a)
+                )
 
     def tearDown(self):
         pass
@@ -296,8 +296,8 @@ def test_SCADAMetaData():
     assert meta.frequency == meta_dict["frequency"]
 
     # Ensure the defaults are the defaults
-    assert meta.units == attr.fields(SCADAMetaData).units.default
-    assert meta.dtypes == attr.fields(SCADAMetaData).dtypes.default
+    assert meta.units == SCADAMetaData.units
+    assert meta.dtypes == SCADAMetaData.dtypes
 
     # Test that non-init elements can't be set
     with pytest.raises(TypeError):
@@ -323,8 +323,8 @@ def test_MeterMetaData():
     assert meta.frequency == meta_dict["frequency"]
 
     # Ensure the defaults are the defaults
-    assert meta.units == attr.fields(MeterMetaData).units.default
-    assert meta.dtypes == attr.fields(MeterMetaData).dtypes.default
+    assert meta.units == MeterMetaData.units
+    assert meta.dtypes == MeterMetaData.dtypes
 
     # Test that non-init elements can't be set
     with pytest.raises(TypeError):
@@ -354,8 +354,8 @@ def test_TowerMetaData():
     assert meta.frequency == meta_dict["frequency"]
 
     # Ensure the defaults are the defaults
-    assert meta.units == attr.fields(TowerMetaData).units.default
-    assert meta.dtypes == attr.fields(TowerMetaData).dtypes.default
+    assert meta.units == TowerMetaData.units
+    assert meta.dtypes == TowerMetaData.dtypes
 
     # Test that non-init elements can't be set
     with pytest.raises(TypeError):
@@ -384,8 +384,8 @@ def test_StatusMetaData():
     assert meta.frequency == meta_dict["frequency"]
 
     # Ensure the defaults are the defaults
-    assert meta.units == attr.fields(StatusMetaData).units.default
-    assert meta.dtypes == attr.fields(StatusMetaData).dtypes.default
+    assert meta.units == StatusMetaData.units
+    assert meta.dtypes == StatusMetaData.dtypes
 
     # Test that non-init elements can't be set
     with pytest.raises(TypeError):
@@ -413,8 +413,8 @@ def test_CurtailMetaData():
     assert meta.frequency == meta_dict["frequency"]
 
     # Ensure the defaults are the defaults
-    assert meta.units == attr.fields(CurtailMetaData).units.default
-    assert meta.dtypes == attr.fields(CurtailMetaData).dtypes.default
+    assert meta.units == CurtailMetaData.units
+    assert meta.dtypes == CurtailMetaData.dtypes
 
     # Test that non-init elements can't be set
     with pytest.raises(TypeError):
@@ -443,8 +443,8 @@ def test_AssetMetaData():
     assert meta.col_map == valid_map
 
     # Ensure the defaults are the defaults
-    assert meta.units == attr.fields(AssetMetaData).units.default
-    assert meta.dtypes == attr.fields(AssetMetaData).dtypes.default
+    assert meta.units == AssetMetaData.units
+    assert meta.dtypes == AssetMetaData.dtypes
 
     # Test that non-init elements can't be set
     with pytest.raises(TypeError):
@@ -473,8 +473,8 @@ def test_ReanalysisMetaData():
     assert meta.col_map == valid_map
 
     # Ensure the defaults are the defaults
-    assert meta.units == attr.fields(ReanalysisMetaData).units.default
-    assert meta.dtypes == attr.fields(ReanalysisMetaData).dtypes.default
+    assert meta.units == ReanalysisMetaData.units
+    assert meta.dtypes == ReanalysisMetaData.dtypes
     assert meta.frequency == attr.fields(ReanalysisMetaData).frequency.default
 
     # Test that non-init elements can't be set
@@ -520,14 +520,14 @@ def test_convert_reanalysis_value():
     assert meta["era5"].frequency == era5_meta_dict["frequency"]
 
     # Ensure the defaults are the defaults
-    assert meta["era5"].units == attr.fields(ReanalysisMetaData).units.default
-    assert meta["era5"].dtypes == attr.fields(ReanalysisMetaData).dtypes.default
+    assert meta["era5"].units == ReanalysisMetaData.units
+    assert meta["era5"].dtypes == ReanalysisMetaData.dtypes
 
     meta = convert_reanalysis(value=dict(era5=dict(), merra2=valid_merra2_map))
     assert meta["merra2"].col_map == valid_merra2_map
     assert meta["merra2"].frequency == attr.fields(ReanalysisMetaData).frequency.default
-    assert meta["merra2"].units == attr.fields(ReanalysisMetaData).units.default
-    assert meta["merra2"].dtypes == attr.fields(ReanalysisMetaData).dtypes.default
+    assert meta["merra2"].units == ReanalysisMetaData.units
+    assert meta["merra2"].dtypes == ReanalysisMetaData.dtypes
 
 
 def test_PlantMetaData_defaults():